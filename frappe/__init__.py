@@ -1251,9 +1251,7 @@ def get_site_path(*joins):
 	"""Return path of current site.
 
 	:param *joins: Join additional path elements using `os.path.join`."""
-	from os.path import join
-
-	return join(local.site_path, *joins)
+	return os.path.join(local.site_path, *joins)
 
 
 def get_pymodule_path(modulename, *joins):
@@ -1261,12 +1259,12 @@ def get_pymodule_path(modulename, *joins):
 
 	:param modulename: Python module name.
 	:param *joins: Join additional path elements using `os.path.join`."""
-	from os.path import abspath, dirname, join
-
 	if "public" not in joins:
 		joins = [scrub(part) for part in joins]
 
-	return abspath(join(dirname(get_module(scrub(modulename)).__file__ or ""), *joins))
+	return os.path.abspath(
+		os.path.join(os.path.dirname(get_module(scrub(modulename)).__file__ or ""), *joins)
+	)
 
 
 def get_module_list(app_name):
@@ -1282,9 +1280,11 @@ def get_all_apps(with_internal_apps=True, sites_path=None):
 	apps = get_file_items(os.path.join(sites_path, "apps.txt"), raise_not_found=True)
 
 	if with_internal_apps:
+		bench_apps = set(apps)
 		for app in get_file_items(os.path.join(local.site_path, "apps.txt")):
-			if app not in apps:
+			if app not in bench_apps:
 				apps.append(app)
+				bench_apps.add(app)
 
 	if "frappe" in apps:
 		apps.remove("frappe")
@@ -1309,7 +1309,7 @@ def get_installed_apps(*, _ensure_on_bench: bool = False) -> list[str]:
 	installed = json.loads(db.get_global("installed_apps") or "[]")
 
 	if _ensure_on_bench:
-		all_apps = cache.get_value("all_apps", get_all_apps)
+		all_apps = set(cache.get_value("all_apps", get_all_apps))
 		installed = [app for app in installed if app in all_apps]
 
 	return installed
@@ -1336,7 +1336,7 @@ def _load_app_hooks(app_name: str | None = None):
 	import types
 
 	hooks = {}
-	apps = [app_name] if app_name else get_installed_apps(_ensure_on_bench=True)
+	apps = (app_name,) if app_name else get_installed_apps(_ensure_on_bench=True)
 
 	for app in apps:
 		try:
@@ -351,10 +351,11 @@ def setup_assets_dirs():
 
 
 def clear_broken_symlinks():
-	for path in os.listdir(assets_path):
-		path = os.path.join(assets_path, path)
-		if os.path.islink(path) and not os.path.exists(path):
-			os.remove(path)
+	with os.scandir(assets_path) as entries:
+		for entry in entries:
+			# DirEntry caches the link check, only symlinks need a stat to resolve their target
+			if entry.is_symlink() and not os.path.exists(entry.path):
+				os.remove(entry.path)
 
 
 def unstrip(message: str) -> str:
@@ -993,13 +993,14 @@ def list_sites(context: CliCtxObj, output_json=False):
 		with open(common_site_config_path) as f:
 			config = json.load(f)
 			default_site = config.get("default_site")
-	sites = [
-		site
-		for site in os.listdir(site_dir)
-		if os.path.isdir(os.path.join(site_dir, site))
-		and not site.startswith(".")
-		and os.path.exists(os.path.join(site_dir, site, "site_config.json"))
-	]
+	with os.scandir(site_dir) as entries:
+		sites = [
+			entry.name
+			for entry in entries
+			if not entry.name.startswith(".")
+			and entry.is_dir()
+			and os.path.exists(os.path.join(entry.path, "site_config.json"))
+		]
 	if output_json:
 		click.echo(json.dumps(sites))
 	elif sites:
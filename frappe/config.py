@@ -25,38 +25,35 @@ def get_site_config(
 	site_path = site_path or getattr(frappe.local, "site_path", None)
 
 	if cached:
-		return _cached_get_site_config(sites_path, site_path).copy()
+		return _dict(_cached_get_site_config(sites_path, site_path))
 	else:
 		return _get_site_config(sites_path, site_path)
 
 
 def _get_site_config(sites_path: str, site_path: str) -> _dict[str, Any]:
-	config: _dict[str, Any] = _dict()
-
 	common_config = get_common_site_config(sites_path)
 
-	if sites_path:
-		config.update(common_config)
+	config: _dict[str, Any] = _dict(common_config) if sites_path else _dict()
 
 	if site_path:
 		site_config = os.path.join(site_path, "site_config.json")
-		if os.path.exists(site_config):
-			try:
-				config.update(get_file_json(site_config))
-			except Exception as error:
-				click.secho(f"{frappe.local.site}/site_config.json is invalid", fg="red")
-				print(error)
-				raise
-		elif frappe.local.site and not frappe.local.flags.new_site:
-			error_msg = f"{frappe.local.site} does not exist."
-			if common_config.developer_mode:
-				from frappe.utils import get_sites
-
-				all_sites = get_sites()
-				error_msg += "\n\nSites on this bench:\n"
-				error_msg += "\n".join(f"* {site}" for site in all_sites)
-
-			raise IncorrectSitePath(error_msg)
+		try:
+			config.update(get_file_json(site_config))
+		except (FileNotFoundError, NotADirectoryError):
+			if frappe.local.site and not frappe.local.flags.new_site:
+				error_msg = f"{frappe.local.site} does not exist."
+				if common_config.developer_mode:
+					from frappe.utils import get_sites
+
+					all_sites = get_sites()
+					error_msg += "\n\nSites on this bench:\n"
+					error_msg += "\n".join(f"* {site}" for site in all_sites)
+
+				raise IncorrectSitePath(error_msg) from None
+		except Exception as error:
+			click.secho(f"{frappe.local.site}/site_config.json is invalid", fg="red")
+			print(error)
+			raise
 
 	# Generalized env variable overrides and defaults
 	def db_default_ports(db_type):
@@ -117,21 +114,21 @@ def get_common_site_config(sites_path: str | None = None, cached=False) -> _dict
 	"""
 	sites_path = sites_path or getattr(frappe.local, "sites_path", ".")
 	if cached:
-		return _cached_get_common_site_config(sites_path).copy()
+		return _dict(_cached_get_common_site_config(sites_path))
 	else:
 		return _get_common_site_config(sites_path)
 
 
 def _get_common_site_config(sites_path: str) -> _dict[str, Any]:
 	common_site_config = os.path.join(sites_path, "common_site_config.json")
-	if os.path.exists(common_site_config):
-		try:
-			return _dict(get_file_json(common_site_config))
-		except Exception as error:
-			click.secho("common_site_config.json is invalid", fg="red")
-			print(error)
-			raise
-	return _dict()
+	try:
+		return _dict(get_file_json(common_site_config))
+	except (FileNotFoundError, NotADirectoryError):
+		return _dict()
+	except Exception as error:
+		click.secho("common_site_config.json is invalid", fg="red")
+		print(error)
+		raise
 
 
 # These variants cache the values in *memory* for repeat access, use it in web requests or anywhere
@@ -50,16 +50,14 @@ class ModuleDef(Document):
 
 	def add_to_modules_txt(self):
 		"""Adds to `[app]/modules.txt`"""
-		modules = None
 		if not frappe.local.module_app.get(frappe.scrub(self.name)):
-			with open(frappe.get_app_path(self.app_name, "modules.txt")) as f:
-				content = f.read()
-				if self.name not in content.splitlines():
-					modules = list(filter(None, content.splitlines()))
-					modules.append(self.name)
-
-			if modules:
-				with open(frappe.get_app_path(self.app_name, "modules.txt"), "w") as f:
+			modules_txt = frappe.get_app_path(self.app_name, "modules.txt")
+			with open(modules_txt) as f:
+				modules = list(filter(None, f.read().splitlines()))
+
+			if self.name not in modules:
+				modules.append(self.name)
+				with open(modules_txt, "w") as f:
 					f.write("\n".join(modules))
 
 				frappe.clear_cache()
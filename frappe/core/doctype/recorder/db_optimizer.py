@@ -51,7 +51,11 @@ class DBIndex:
 	nullable: bool = True
 	_score: float = 0.0
 
-	def __eq__(self, other: "DBIndex") -> bool:
+	def __eq__(self, other: object) -> bool:
+		if other is self:
+			return True
+		if not isinstance(other, DBIndex):
+			return NotImplemented
 		return self.column == other.column and self.sequence == other.sequence and self.table == other.table
 
 	def __repr__(self):
@@ -662,15 +662,20 @@ def get_conf_params(db_name=None, db_password=None):
 
 
 def make_site_dirs():
-	for dir_path in [
+	site_path = frappe.get_site_path()
+
+	# create the shared parents once, so the leaves don't each walk up to the site folder
+	for dir_path in ("public", "private"):
+		os.makedirs(os.path.join(site_path, dir_path), exist_ok=True)
+
+	for dir_path in (
 		os.path.join("public", "files"),
 		os.path.join("private", "backups"),
 		os.path.join("private", "files"),
 		"locks",
 		"logs",
-	]:
-		path = frappe.get_site_path(dir_path)
-		os.makedirs(path, exist_ok=True)
+	):
+		os.makedirs(os.path.join(site_path, dir_path), exist_ok=True)
 
 
 def add_module_defs(app, ignore_if_duplicate=False):
@@ -172,6 +172,10 @@ class BaseDocument:
 	def _weakref(self):
 		return weakref.ref(self)
 
+	@cached_property
+	def _precision(self) -> _dict:
+		return _dict()
+
 	def __getstate__(self):
 		"""Return a copy of `__dict__` excluding unpicklable values like `meta`.
 
@@ -570,13 +574,11 @@ class BaseDocument:
 
 		if no_default_fields:
 			for key in default_fields:
-				if key in doc:
-					del doc[key]
+				doc.pop(key, None)
 
 		if no_child_table_fields:
 			for key in child_table_fields:
-				if key in doc:
-					del doc[key]
+				doc.pop(key, None)
 
 		if not no_private_properties:
 			for key in (
@@ -1242,22 +1244,21 @@ class BaseDocument:
 
 		cache_key = parentfield or "main"
 
-		if not hasattr(self, "_precision"):
-			self._precision = _dict()
-
-		if cache_key not in self._precision:
-			self._precision[cache_key] = _dict()
+		try:
+			precision = self._precision[cache_key]
+		except KeyError:
+			precision = self._precision[cache_key] = _dict()
 
-		if fieldname not in self._precision[cache_key]:
-			self._precision[cache_key][fieldname] = None
+		if fieldname not in precision:
+			precision[fieldname] = None
 
 			doctype = self.meta.get_field(parentfield).options if parentfield else self.doctype
 			df = frappe.get_meta(doctype).get_field(fieldname)
 
 			if df.fieldtype in ("Currency", "Float", "Percent"):
-				self._precision[cache_key][fieldname] = get_field_precision(df, self)
+				precision[fieldname] = get_field_precision(df, self)
 
-		return self._precision[cache_key][fieldname]
+		return precision[fieldname]
 
 	def get_formatted(
 		self, fieldname, doc=None, currency=None, absolute_value=False, translated=False, format=None
@@ -1841,12 +1841,11 @@ class Document(BaseDocument, DocRef):
 		return f"{self.doctype} ({self.name or 'unsaved'})"
 
 	def __repr__(self):
-		doctype = f"doctype={self.doctype}"
-		name = self.name or "unsaved"
 		docstatus = f" docstatus={self.docstatus}" if self.docstatus else ""
-		parent = f" parent={self.parent}" if getattr(self, "parent", None) else ""
+		parent = f" parent={parent_name}" if (parent_name := getattr(self, "parent", None)) else ""
+		name = self.name or "unsaved"
 
-		return f"<{self.__class__.__name__}: {doctype} {name}{docstatus}{parent}>"
+		return f"<{self.__class__.__name__}: doctype={self.doctype} {name}{docstatus}{parent}>"
 
 
 def execute_action(__doctype, __name, __action, **kwargs):
@@ -126,18 +126,24 @@ def get_doc_files(files, start_path):
 	"""walk and sync all doctypes and pages"""
 
 	files = files or []
+	seen_files = set(files)
 
 	for _module, doctype in IMPORTABLE_DOCTYPES + [
 		(None, frappe.scrub(dt)) for dt in frappe.get_hooks("importable_doctypes")
 	]:
 		doctype_path = os.path.join(start_path, doctype)
-		if os.path.exists(doctype_path):
-			for docname in os.listdir(doctype_path):
-				if os.path.isdir(os.path.join(doctype_path, docname)):
-					doc_path = os.path.join(doctype_path, docname, docname) + ".json"
-					if os.path.exists(doc_path):
-						if doc_path not in files:
-							files.append(doc_path)
+		try:
+			with os.scandir(doctype_path) as entries:
+				doc_paths = [
+					os.path.join(entry.path, entry.name) + ".json" for entry in entries if entry.is_dir()
+				]
+		except FileNotFoundError:
+			continue
+
+		for doc_path in doc_paths:
+			if doc_path not in seen_files and os.path.exists(doc_path):
+				files.append(doc_path)
+				seen_files.add(doc_path)
 
 	return files
 
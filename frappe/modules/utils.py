@@ -101,22 +101,27 @@ def sync_customizations(app=None):
 	"""Sync custom fields and property setters from custom folder in each app module"""
 
 	if app:
-		apps = [app]
+		apps = (app,)
 	else:
 		apps = frappe.get_installed_apps()
 
 	for app_name in apps:
 		for module_name in frappe.local.app_modules.get(app_name) or []:
 			folder = frappe.get_app_path(app_name, module_name, "custom")
-			if os.path.exists(folder):
-				for fname in os.listdir(folder):
-					if fname.endswith(".json"):
-						with open(os.path.join(folder, fname)) as f:
-							data = json.loads(f.read())
-						if data.get("sync_on_migrate"):
-							sync_customizations_for_doctype(data, folder, fname)
-						elif frappe.flags.in_install and app:
-							sync_customizations_for_doctype(data, folder, fname)
+			try:
+				# most modules don't have a custom folder
+				fnames = os.listdir(folder)
+			except FileNotFoundError:
+				continue
+
+			for fname in fnames:
+				if fname.endswith(".json"):
+					with open(os.path.join(folder, fname)) as f:
+						data = json.loads(f.read())
+					if data.get("sync_on_migrate"):
+						sync_customizations_for_doctype(data, folder, fname)
+					elif frappe.flags.in_install and app:
+						sync_customizations_for_doctype(data, folder, fname)
 
 
 def sync_customizations_for_doctype(data: dict, folder: str, filename: str = ""):
@@ -1,6 +1,11 @@
 # Copyright (c) 2022, Frappe Technologies Pvt. Ltd. and Contributors
 # License: MIT. See LICENSE
+import os
+from tempfile import TemporaryDirectory
+
 import frappe
+from frappe.config import get_site_config
+from frappe.exceptions import IncorrectSitePath
 from frappe.tests import IntegrationTestCase
 from frappe.utils.modules import get_modules_from_all_apps_for_user
 
@@ -12,3 +17,11 @@ class TestConfig(IntegrationTestCase):
 		all_modules = [x["module_name"] for x in all_modules_data]
 		self.assertIsInstance(all_modules_data, list)
 		self.assertFalse([x for x in frappe_modules if x not in all_modules])
+
+	def test_site_path_is_a_file(self):
+		with TemporaryDirectory() as sites_path:
+			site_path = os.path.join(sites_path, "apps.txt")
+			with open(site_path, "w") as f:
+				f.write("frappe")
+
+			self.assertRaises(IncorrectSitePath, get_site_config, sites_path=sites_path, site_path=site_path)
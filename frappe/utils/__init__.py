@@ -513,9 +513,14 @@ def get_files_path(*path, **kwargs):
 
 
 def get_bench_path():
-	return os.environ.get("FRAPPE_BENCH_ROOT") or os.path.realpath(
-		os.path.join(os.path.dirname(frappe.__file__), "..", "..", "..")
-	)
+	return os.environ.get("FRAPPE_BENCH_ROOT") or _get_default_bench_path()
+
+
+@functools.cache
+def _get_default_bench_path() -> str:
+	# realpath walks every component of the path, the install location doesn't change for the
+	# lifetime of the process
+	return os.path.realpath(os.path.join(os.path.dirname(frappe.__file__), "..", "..", ".."))
 
 
 def get_bench_id():
@@ -674,16 +679,13 @@ def get_sites(sites_path=None):
 		sites_path = getattr(frappe.local, "sites_path", None) or "."
 
 	sites = []
-	for site in os.listdir(sites_path):
-		path = os.path.join(sites_path, site)
-
-		if (
-			os.path.isdir(path)
-			and not os.path.islink(path)
-			and os.path.exists(os.path.join(path, "site_config.json"))
-		):
-			# is a dir and has site_config.json
-			sites.append(site)
+	with os.scandir(sites_path) as entries:
+		for entry in entries:
+			if entry.is_dir(follow_symlinks=False) and os.path.exists(
+				os.path.join(entry.path, "site_config.json")
+			):
+				# is a dir (not a symlink) and has site_config.json
+				sites.append(entry.name)
 
 	return sorted(sites)
 
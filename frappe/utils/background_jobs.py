@@ -566,12 +566,10 @@ def get_redis_conn(username=None, password=None):
 	if not hasattr(frappe.local, "conf"):
 		raise Exception("You need to call frappe.init")
 
-	conf = frappe.get_site_config()
+	conf = frappe.local.conf
 	if not conf.redis_queue:
 		raise Exception("redis_queue missing in common_site_config.json")
 
-	global _redis_queue_conn
-
 	cred = frappe._dict()
 	if conf.get("use_rq_auth"):
 		if username:
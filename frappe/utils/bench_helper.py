@@ -7,6 +7,7 @@ import sys
 import traceback
 import warnings
 from dataclasses import dataclass
+from functools import cached_property
 from textwrap import dedent
 
 import click
@@ -59,10 +60,16 @@ def FrappeClickWrapper(cls, handler):
 # for type hints
 @dataclass
 class CliCtxObj:
-	sites: list[str]
 	force: bool
 	profile: bool
 	verbose: bool
+	site_arg: str | None = None
+
+	@cached_property
+	def sites(self) -> list[str]:
+		# resolved on first access so that commands which never touch sites skip
+		# initializing frappe just to read the default site
+		return get_sites(self.site_arg)
 
 
 def handle_exception(cmd, info_name, exc):
@@ -104,7 +111,7 @@ def get_app_group(app: str) -> click.Group:
 @click.option("--force", is_flag=True, default=False, help="Force")
 @click.pass_context
 def app_group(ctx, site=False, force=False, verbose=False, profile=False):
-	ctx.obj = CliCtxObj(sites=get_sites(site), force=force, verbose=verbose, profile=profile)
+	ctx.obj = CliCtxObj(site_arg=site, force=force, verbose=verbose, profile=profile)
 	if ctx.info_name == "frappe":
 		ctx.info_name = ""
 
@@ -122,6 +122,9 @@ def site_cache(ttl: int | None = None, maxsize: int | None = None) -> Callable:
 		if maxsize is not None and not callable(maxsize):
 			func.maxsize = maxsize
 
+		has_ttl = hasattr(func, "ttl")
+		has_maxsize = hasattr(func, "maxsize")
+
 		@wraps(func)
 		def site_cache_wrapper(*args, **kwargs):
 			site = getattr(frappe.local, "site", None)
@@ -130,9 +133,9 @@ def site_cache(ttl: int | None = None, maxsize: int | None = None) -> Callable:
 
 			arguments_key = (site, __generate_request_cache_key(args, kwargs))
 
-			if hasattr(func, "ttl") and time.monotonic() >= func.expiration:
+			if has_ttl and (now := time.monotonic()) >= func.expiration:
 				func.clear_cache()
-				func.expiration = time.monotonic() + func.ttl
+				func.expiration = now + func.ttl
 
 			# NOTE: Important things to consider from thread safety POV:
 			#   1. Other thread can issue clear_cache and delete entire dictionary.
@@ -149,7 +152,7 @@ def site_cache(ttl: int | None = None, maxsize: int | None = None) -> Callable:
 				# NOTE: This is just a cache miss or dictionary was modified while reading it
 				pass
 
-			if hasattr(func, "maxsize") and len(function_cache) >= func.maxsize:
+			if has_maxsize and len(function_cache) >= func.maxsize:
 				# Note: This implements FIFO eviction policy
 				with suppress(RuntimeError):
 					function_cache.pop(next(iter(function_cache)), None)